@@ -41,6 +41,9 @@ from .NodeMakingHelpers import (
 )
 from .shapes.StandardShapes import tshape_unknown
 
+# Options do not change during optimization, avoid asking them per node.
+_del_optimization = isExperimental("del_optimization")
+
 
 class StatementAssignmentVariableName(StatementChildHavingBase):
     """Precursor of StatementAssignmentVariable used during tree building phase"""
@@ -241,6 +244,10 @@ class StatementAssignmentVariable(StatementChildHavingBase):
         # TODO: Way too ugly to have global trace kinds just here, and needs to
         # be abstracted somehow. But for now we let it live here.
         source = self.subnode_source
+        variable = self.variable
+
+        # Not allowed anymore at this point.
+        assert variable is not None
 
         if source.isExpressionSideEffects():
             # If the assignment source has side effects, we can put them into a
@@ -272,7 +279,7 @@ Side effects of assignments promoted to statements.""",
             )
 
         # Let assignment source may re-compute first.
-        source = trace_collection.onExpression(self.subnode_source)
+        source = trace_collection.onExpression(source)
 
         # No assignment will occur, if the assignment source raises, so give up
         # on this, and return it as the only side effect.
@@ -290,11 +297,6 @@ Side effects of assignments promoted to statements.""",
 Assignment raises exception in assigned value, removed assignment.""",
             )
 
-        variable = self.variable
-
-        # Not allowed anymore at this point.
-        assert variable is not None
-
         # Assigning from and to the same variable, can be optimized away
         # immediately, there is no point in doing it. Exceptions are of course
         # module variables that collide with built-in names.
@@ -303,10 +305,11 @@ Assignment raises exception in assigned value, removed assignment.""",
         # are to be a feature of the trace. Assigning from known assigned is
         # supposed to be possible to eliminate. If we get that wrong, we are
         # doing it wrong.
+        # Check the identity first, it rules out nearly all assignments.
         if (
-            not variable.isModuleVariable()
-            and source.isExpressionVariableRef()
-            and source.getVariable() is variable
+            source.isExpressionVariableRef()
+            and source.variable is variable
+            and not variable.isModuleVariable()
         ):
 
             # A variable access that has a side effect, must be preserved,
@@ -320,7 +323,7 @@ Assignment raises exception in assigned value, removed assignment.""",
                 return (
                     result,
                     "new_statements",
-                    """\
+                    lambda: """\
 Lowered assignment of %s from itself to mere access of it."""
                     % variable.getDescription(),
                 )
@@ -328,77 +331,66 @@ Lowered assignment of %s from itself to mere access of it."""
                 return (
                     None,
                     "new_statements",
-                    """\
+                    lambda: """\
 Removed assignment of %s from itself which is known to be defined."""
                     % variable.getDescription(),
                 )
 
         # Set-up the trace to the trace collection, so future references will
         # find this assignment.
-        self.variable_trace = trace_collection.onVariableSet(
+        variable_trace = trace_collection.onVariableSet(
             variable=variable, version=self.variable_version, assign_node=self
         )
+        self.variable_trace = variable_trace
 
         provider = trace_collection.getOwner()
 
-        if variable.hasAccessesOutsideOf(provider) is False:
-            last_trace = variable.getMatchingAssignTrace(self)
+        # Below are only checks, if the assignment can be dropped, which needs
+        # the variable and its assignment trace to be fully known locally.
+        if variable.hasAccessesOutsideOf(provider) is not False:
+            return self, None, None
 
-            if last_trace is not None and not last_trace.getMergeOrNameUsageCount():
-                if source.isCompileTimeConstant():
-                    if variable.isModuleVariable():
-                        # TODO: We do not trust these yet a lot, but more might be
-                        pass
-                    else:
-                        # Unused constants can be eliminated in any case.
-                        if not last_trace.getUsageCount():
-                            if not last_trace.getPrevious().isUnassignedTrace():
-                                result = StatementDelVariable(
-                                    variable=self.variable,
-                                    version=self.variable_version,
-                                    tolerant=True,
-                                    source_ref=self.source_ref,
-                                )
-                            else:
-                                result = None
-
-                            return (
-                                result,
-                                "new_statements",
-                                "Dropped dead assignment statement to '%s'."
-                                % (self.getVariableName()),
-                            )
-
-                        # Can safely forward propagate only non-mutable constants.
-                        if not source.isMutable():
-                            self.variable_trace.setReplacementNode(
-                                lambda _usage: source.makeClone()
-                            )
-
-                            if not last_trace.getPrevious().isUnassignedTrace():
-                                result = StatementDelVariable(
-                                    variable=self.variable,
-                                    version=self.variable_version,
-                                    tolerant=True,
-                                    source_ref=self.source_ref,
-                                )
-                            else:
-                                result = None
-
-                            return (
-                                result,
-                                "new_statements",
-                                "Dropped propagated assignment statement to '%s'."
-                                % self.getVariableName(),
-                            )
-                elif source.isExpressionFunctionCreation():
-                    # TODO: Prepare for inlining.
-                    pass
-                else:
-                    # More cases thinkable.
-                    pass
+        last_trace = variable.getMatchingAssignTrace(self)
 
-        return self, None, None
+        if last_trace is None or last_trace.getMergeOrNameUsageCount():
+            return self, None, None
+
+        # TODO: Prepare function creations for inlining, more cases thinkable.
+        if not source.isCompileTimeConstant():
+            return self, None, None
+
+        # TODO: We do not trust these yet a lot, but more might be
+        if variable.isModuleVariable():
+            return self, None, None
+
+        # Unused constants can be eliminated in any case, but only non-mutable
+        # constants can safely be forward propagated to their usages.
+        if last_trace.getUsageCount():
+            if source.isMutable():
+                return self, None, None
+
+            variable_trace.setReplacementNode(lambda _usage: source.makeClone())
+
+            drop_kind = "propagated"
+        else:
+            drop_kind = "dead"
+
+        if not last_trace.getPrevious().isUnassignedTrace():
+            result = StatementDelVariable(
+                variable=variable,
+                version=self.variable_version,
+                tolerant=True,
+                source_ref=self.source_ref,
+            )
+        else:
+            result = None
+
+        return (
+            result,
+            "new_statements",
+            lambda: "Dropped %s assignment statement to '%s'."
+            % (drop_kind, variable.getName()),
+        )
 
     def needsReleasePreviousValue(self):
         previous = self.variable_trace.getPrevious()
@@ -447,6 +439,7 @@ class StatementDelVariable(StatementBase):
         "variable_version",
         "variable_trace",
         "previous_trace",
+        "previous_trace_has_value",
         "tolerant",
     )
 
@@ -467,6 +460,9 @@ class StatementDelVariable(StatementBase):
         self.variable_trace = None
         self.previous_trace = None
 
+        # Cached answer of the previous trace, see "mayRaiseException".
+        self.previous_trace_has_value = None
+
         self.tolerant = tolerant
 
     def finalize(self):
@@ -474,6 +470,7 @@ class StatementDelVariable(StatementBase):
         del self.variable
         del self.variable_trace
         del self.previous_trace
+        del self.previous_trace_has_value
 
     def getDetails(self):
         return {
@@ -556,23 +553,26 @@ class StatementDelVariable(StatementBase):
             return (
                 None,
                 "new_statements",
-                "Removed 'del' statement of boolean '%s' without effect."
-                % (self.getVariableName(),),
+                lambda: "Removed 'del' statement of boolean '%s' without effect."
+                % (variable.getName(),),
             )
 
-        self.previous_trace = trace_collection.getVariableCurrentTrace(variable)
+        previous_trace = trace_collection.getVariableCurrentTrace(variable)
+        self.previous_trace = previous_trace
+
+        tolerant = self.tolerant
 
         # First eliminate us entirely if we can.
-        if self.previous_trace.mustNotHaveValue():
-            if self.tolerant:
+        if previous_trace.mustNotHaveValue():
+            if tolerant:
                 return (
                     None,
                     "new_statements",
-                    "Removed tolerant 'del' statement of '%s' without effect."
-                    % (self.getVariableName(),),
+                    lambda: "Removed tolerant 'del' statement of '%s' without effect."
+                    % (variable.getName(),),
                 )
             else:
-                assert self.variable.isLocalVariable(), self.variable
+                assert variable.isLocalVariable(), variable
 
                 result = makeRaiseExceptionReplacementStatement(
                     statement=self,
@@ -584,17 +584,17 @@ class StatementDelVariable(StatementBase):
                 return trace_collection.computedStatementResult(
                     result,
                     "new_raise",
-                    "Variable del of not initialized variable '%s'"
+                    lambda: "Variable del of not initialized variable '%s'"
                     % variable.getName(),
                 )
 
-        if not self.tolerant:
-            self.previous_trace.addNameUsage()
+        if not tolerant:
+            previous_trace.addNameUsage()
 
         # TODO: Why doesn't this module variable check not follow from other checks done here, e.g. name usages.
         # TODO: This currently cannot be done as releases do not create successor traces yet, although they
         # probably should.
-        if isExperimental("del_optimization") and not variable.isModuleVariable():
+        if _del_optimization and not variable.isModuleVariable():
             provider = trace_collection.getOwner()
 
             if variable.hasAccessesOutsideOf(provider) is False:
@@ -609,12 +609,12 @@ class StatementDelVariable(StatementBase):
                         return trace_collection.computedStatementResult(
                             result,
                             "new_statements",
-                            "Changed del to release for variable '%s' not used afterwards."
+                            lambda: "Changed del to release for variable '%s' not used afterwards."
                             % variable.getName(),
                         )
 
         # If not tolerant, we may exception exit now during the __del__
-        if not self.tolerant and not self.previous_trace.mustHaveValue():
+        if not tolerant and not previous_trace.mustHaveValue():
             trace_collection.onExceptionRaiseExit(BaseException)
 
         # Record the deletion, needs to start a new version then.
@@ -644,11 +644,24 @@ class StatementDelVariable(StatementBase):
                     return False
 
                 # If SSA knows, that's fine.
-                if (
-                    self.previous_trace is not None
-                    and self.previous_trace.mustHaveValue()
-                ):
-                    return False
+                previous_trace = self.previous_trace
+
+                if previous_trace is not None:
+                    # Merge traces need to ask all their previous traces, so the
+                    # answer is remembered for the trace object. Loop traces are
+                    # still getting previous traces added, do not cache those.
+                    cached = self.previous_trace_has_value
+
+                    if cached is not None and cached[0] is previous_trace:
+                        has_value = cached[1]
+                    else:
+                        has_value = previous_trace.mustHaveValue()
+
+                        if not previous_trace.isLoopTrace():
+                            self.previous_trace_has_value = previous_trace, has_value
+
+                    if has_value:
+                        return False
 
             return True
 
@@ -710,25 +723,29 @@ class StatementReleaseVariable(StatementBase):
         self.variable = variable
 
     def computeStatement(self, trace_collection):
-        if self.variable.isParameterVariable():
-            if self.variable.getOwner().isAutoReleaseVariable(self.variable):
+        variable = self.variable
+
+        if variable.isParameterVariable():
+            if variable.getOwner().isAutoReleaseVariable(variable):
                 return (
                     None,
                     "new_statements",
-                    "Original parameter variable value %s is not released."
-                    % (self.variable.getDescription()),
+                    lambda: "Original parameter variable value %s is not released."
+                    % (variable.getDescription()),
                 )
 
-        self.variable_trace = trace_collection.getVariableCurrentTrace(self.variable)
+        variable_trace = trace_collection.getVariableCurrentTrace(variable)
+        self.variable_trace = variable_trace
 
-        if self.variable_trace.mustNotHaveValue():
+        if variable_trace.mustNotHaveValue():
             return (
                 None,
                 "new_statements",
-                "Uninitialized %s is not released." % (self.variable.getDescription()),
+                lambda: "Uninitialized %s is not released."
+                % (variable.getDescription()),
             )
 
-        trace_collection.onVariableContentEscapes(self.variable)
+        trace_collection.onVariableContentEscapes(variable)
 
         # Any code could be run, note that.
         trace_collection.onControlFlowEscape(self)
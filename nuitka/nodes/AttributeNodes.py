@@ -62,7 +62,7 @@ class StatementAssignmentAttribute(StatementChildrenHavingBase):
     def __init__(self, expression, attribute_name, source, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={"expression": expression, "source": source},
+            children=(source, expression),
             source_ref=source_ref,
         )
 
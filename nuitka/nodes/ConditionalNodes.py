@@ -417,11 +417,7 @@ class StatementConditional(StatementChildrenHavingBase):
     def __init__(self, condition, yes_branch, no_branch, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={
-                "condition": condition,
-                "yes_branch": yes_branch,
-                "no_branch": no_branch,
-            },
+            children=(condition, yes_branch, no_branch),
             source_ref=source_ref,
         )
 
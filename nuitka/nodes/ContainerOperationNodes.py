@@ -36,7 +36,7 @@ class StatementListOperationAppend(StatementChildrenHavingBase):
         assert value is not None
 
         StatementChildrenHavingBase.__init__(
-            self, values={"list_arg": list_arg, "value": value}, source_ref=source_ref
+            self, children=(list_arg, value), source_ref=source_ref
         )
 
     def computeStatement(self, trace_collection):
@@ -107,7 +107,7 @@ class StatementSetOperationAdd(StatementChildrenHavingBase):
         assert value is not None
 
         StatementChildrenHavingBase.__init__(
-            self, values={"set_arg": set_arg, "value": value}, source_ref=source_ref
+            self, children=(set_arg, value), source_ref=source_ref
         )
 
     def computeStatement(self, trace_collection):
@@ -348,9 +348,12 @@ class StatementDictOperationSet(StatementChildrenHavingBase):
         assert key is not None
         assert value is not None
 
+        # Follow the order of "named_children", which subclasses may change.
+        children = {"value": value, "dict_arg": dict_arg, "key": key}
+
         StatementChildrenHavingBase.__init__(
             self,
-            values={"dict_arg": dict_arg, "key": key, "value": value},
+            children=tuple(children[name] for name in self.named_children),
             source_ref=source_ref,
         )
 
@@ -412,7 +415,7 @@ class StatementDictOperationRemove(StatementChildrenHavingBase):
         assert key is not None
 
         StatementChildrenHavingBase.__init__(
-            self, values={"dict_arg": dict_arg, "key": key}, source_ref=source_ref
+            self, children=(dict_arg, key), source_ref=source_ref
         )
 
     def computeStatement(self, trace_collection):
@@ -483,7 +486,7 @@ class StatementDictOperationUpdate(StatementChildrenHavingBase):
         assert value is not None
 
         StatementChildrenHavingBase.__init__(
-            self, values={"dict_arg": dict_arg, "value": value}, source_ref=source_ref
+            self, children=(dict_arg, value), source_ref=source_ref
         )
 
     def computeStatement(self, trace_collection):
@@ -73,12 +73,12 @@ class StatementRaiseException(
 
         StatementChildrenHavingBase.__init__(
             self,
-            values={
-                "exception_type": exception_type,
-                "exception_value": exception_value,
-                "exception_trace": exception_trace,
-                "exception_cause": exception_cause,
-            },
+            children=(
+                exception_type,
+                exception_value,
+                exception_trace,
+                exception_cause,
+            ),
             source_ref=source_ref,
         )
 
@@ -143,11 +143,7 @@ class StatementExec(StatementChildrenHavingBase):
     def __init__(self, source_code, globals_arg, locals_arg, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={
-                "globals_arg": globals_arg,
-                "locals_arg": locals_arg,
-                "source": source_code,
-            },
+            children=(source_code, globals_arg, locals_arg),
             source_ref=source_ref,
         )
 
@@ -1097,7 +1097,7 @@ class ExpressionChildrenHavingBase(ChildrenHavingMixin, ExpressionBase):
     def __init__(self, values, source_ref):
         ExpressionBase.__init__(self, source_ref=source_ref)
 
-        ChildrenHavingMixin.__init__(self, values=values)
+        self._initChildren(values)
 
     def computeExpressionRaw(self, trace_collection):
         """Compute an expression.
@@ -1156,8 +1156,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         else:
             assert False, type(value)
 
-        attr_name = "subnode_" + self.named_child
-        setattr(self, attr_name, value)
+        setattr(self, self.named_child_attribute, value)
 
     def finalize(self):
         del self.parent
@@ -1219,7 +1218,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         elif value is not None:
             value.parent = self
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attribute
 
         # TODO: This is not being done for any variant of this, this only checks if it's a real change,
         # but that should only be done in debug mode maybe.
@@ -1237,7 +1236,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         if self.checker is not None:
             self.checker(None)  # False alarm, pylint: disable=not-callable
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attribute
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -1247,13 +1246,13 @@ class ExpressionChildHavingBase(ExpressionBase):
 
     def getChild(self, name):
         # Only accept legal child names
-        attr_name = "subnode_" + name
-        return getattr(self, attr_name)
+        assert name == self.named_child, name
+
+        return getattr(self, self.named_child_attribute)
 
     def getVisitableNodes(self):
         # TODO: Consider if a generator would be faster.
-        attr_name = "subnode_" + self.named_child
-        value = getattr(self, attr_name)
+        value = getattr(self, self.named_child_attribute)
 
         if value is None:
             return ()
@@ -1269,8 +1268,7 @@ class ExpressionChildHavingBase(ExpressionBase):
 
         For use in debugging and XML output.
         """
-        attr_name = "subnode_" + self.named_child
-        value = getattr(self, attr_name)
+        value = getattr(self, self.named_child_attribute)
 
         yield self.named_child, value
 
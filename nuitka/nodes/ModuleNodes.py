@@ -251,9 +251,7 @@ class CompiledPythonModule(
             self, name=module_name.getBasename(), code_prefix="module"
         )
 
-        ChildrenHavingMixin.__init__(
-            self, values={"body": None, "functions": ()}  # delayed
-        )
+        self._initChildren(values={"body": None, "functions": ()})  # delayed
 
         MarkNeedsAnnotationsMixin.__init__(self)
 
@@ -513,10 +513,14 @@ class ChildrenHavingMixin(object):
     __slots__ = ()
 
     named_children = ()
+    named_children_attributes = ()
+    named_children_attributes_by_name = {}
 
     checkers = {}
 
-    def __init__(self, values):
+    def _initChildren(self, values):
+        """Initialize the children from a dictionary of all named children."""
+
         assert (
             type(self.named_children) is tuple and self.named_children
         ), self.named_children
@@ -533,21 +537,29 @@ class ChildrenHavingMixin(object):
                 set(self.named_children),
             )
 
-        for name, value in values.items():
-            if name in self.checkers:
-                value = self.checkers[name](value)
+        attributes_by_name = self.named_children_attributes_by_name
+
+        self._initChildValues(
+            (name, attributes_by_name[name], value) for name, value in values.items()
+        )
+
+    def _initChildValues(self, named_values):
+        """Initialize children from (name, attr_name, value) triples."""
+
+        checkers = self.checkers
+
+        for name, attr_name, value in named_values:
+            if name in checkers:
+                value = checkers[name](value)
 
             if type(value) is tuple:
                 assert None not in value, name
 
                 for val in value:
                     val.parent = self
-            elif value is None:
-                pass
-            else:
+            elif value is not None:
                 value.parent = self
 
-            attr_name = "subnode_" + name
             setattr(self, attr_name, value)
 
     def setChild(self, name, value):
@@ -572,7 +584,7 @@ class ChildrenHavingMixin(object):
         elif value is not None:
             value.parent = self
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_children_attributes_by_name[name]
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -588,7 +600,7 @@ class ChildrenHavingMixin(object):
         if name in self.checkers:
             self.checkers[name](None)
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_children_attributes_by_name[name]
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -598,16 +610,14 @@ class ChildrenHavingMixin(object):
         setattr(self, attr_name, None)
 
     def getChild(self, name):
-        attr_name = "subnode_" + name
+        attr_name = self.named_children_attributes_by_name[name]
         return getattr(self, attr_name)
 
     def getVisitableNodes(self):
         # TODO: Consider if a generator would be faster.
         result = []
 
-        for name in self.named_children:
-            attr_name = "subnode_" + name
-
+        for attr_name in self.named_children_attributes:
             value = getattr(self, attr_name)
 
             if value is None:
@@ -618,7 +628,7 @@ class ChildrenHavingMixin(object):
                 result.append(value)
             else:
                 raise AssertionError(
-                    self, "has illegal child", name, value, value.__class__
+                    self, "has illegal child", attr_name, value, value.__class__
                 )
 
         return tuple(result)
@@ -628,8 +638,7 @@ class ChildrenHavingMixin(object):
 
         For use in debugging and XML output.
         """
-        for name in self.named_children:
-            attr_name = "subnode_" + name
+        for name, attr_name in zip(self.named_children, self.named_children_attributes):
             value = getattr(self, attr_name)
 
             yield name, value
@@ -907,10 +916,16 @@ class StatementBase(NodeBase):
 
 
 class StatementChildrenHavingBase(ChildrenHavingMixin, StatementBase):
-    def __init__(self, values, source_ref):
+    def __init__(self, children, source_ref):
+        """Children are given as a tuple in the order of "named_children"."""
+
         StatementBase.__init__(self, source_ref=source_ref)
 
-        ChildrenHavingMixin.__init__(self, values=values)
+        assert len(children) == len(self.named_children), self.named_children
+
+        self._initChildValues(
+            zip(self.named_children, self.named_children_attributes, children)
+        )
 
 
 class StatementChildHavingBase(StatementBase):
@@ -940,8 +955,7 @@ class StatementChildHavingBase(StatementBase):
         else:
             assert False, type(value)
 
-        attr_name = "subnode_" + self.named_child
-        setattr(self, attr_name, value)
+        setattr(self, self.named_child_attribute, value)
 
     def setChild(self, name, value):
         """Set a child value.
@@ -965,7 +979,7 @@ class StatementChildHavingBase(StatementBase):
         elif value is not None:
             value.parent = self
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attribute
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -976,13 +990,13 @@ class StatementChildHavingBase(StatementBase):
 
     def getChild(self, name):
         # Only accept legal child names
-        attr_name = "subnode_" + name
-        return getattr(self, attr_name)
+        assert name == self.named_child, name
+
+        return getattr(self, self.named_child_attribute)
 
     def getVisitableNodes(self):
         # TODO: Consider if a generator would be faster.
-        attr_name = "subnode_" + self.named_child
-        value = getattr(self, attr_name)
+        value = getattr(self, self.named_child_attribute)
 
         if value is None:
             return ()
@@ -998,8 +1012,7 @@ class StatementChildHavingBase(StatementBase):
 
         For use in debugging and XML output.
         """
-        attr_name = "subnode_" + self.named_child
-        value = getattr(self, attr_name)
+        value = getattr(self, self.named_child_attribute)
 
         yield self.named_child, value
 
@@ -1065,7 +1078,7 @@ class StatementChildHavingBase(StatementBase):
     def finalize(self):
         del self.parent
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attribute
         child = getattr(self, attr_name)
         if child is not None:
             child.finalize()
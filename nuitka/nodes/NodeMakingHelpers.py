@@ -395,6 +395,15 @@ def wrapStatementWithSideEffects(new_node, old_node, allow_none=False):
 def makeStatementOnlyNodesFromExpressions(expressions):
     from .StatementNodes import StatementExpressionOnly, StatementsSequence
 
+    # Very often there is only one expression, e.g. when the first child of
+    # a statement raises, avoid building a tuple for it.
+    if len(expressions) == 1:
+        expression = expressions[0]
+
+        return StatementExpressionOnly(
+            expression=expression, source_ref=expression.getSourceReference()
+        )
+
     statements = tuple(
         StatementExpressionOnly(
             expression=expression, source_ref=expression.getSourceReference()
@@ -62,8 +62,13 @@ class NodeCheckMetaClass(ABCMeta):
         if "__slots__" not in dictionary:
             dictionary["__slots__"] = ()
 
+        # Children live in slots, and their attribute names are provided as
+        # class constants, so accesses need not compute them each time.
         if "named_child" in dictionary:
-            dictionary["__slots__"] += (intern("subnode_" + dictionary["named_child"]),)
+            named_child_attribute = intern("subnode_" + dictionary["named_child"])
+
+            dictionary["__slots__"] += (named_child_attribute,)
+            dictionary["named_child_attribute"] = named_child_attribute
 
         if "named_children" in dictionary:
             if len(dictionary["named_children"]) <= 1:
@@ -72,11 +77,17 @@ class NodeCheckMetaClass(ABCMeta):
                 )
 
             assert type(dictionary["named_children"]) is tuple
-            dictionary["__slots__"] += tuple(
+            named_children_attributes = tuple(
                 intern("subnode_" + named_child)
                 for named_child in dictionary["named_children"]
             )
 
+            dictionary["__slots__"] += named_children_attributes
+            dictionary["named_children_attributes"] = named_children_attributes
+            dictionary["named_children_attributes_by_name"] = dict(
+                zip(dictionary["named_children"], named_children_attributes)
+            )
+
         # Not a method:
         if "checker" in dictionary:
             dictionary["checker"] = staticmethod(dictionary["checker"])
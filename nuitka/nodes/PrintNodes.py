@@ -40,7 +40,7 @@ class StatementPrintValue(StatementChildrenHavingBase):
 
     def __init__(self, dest, value, source_ref):
         StatementChildrenHavingBase.__init__(
-            self, values={"value": value, "dest": dest}, source_ref=source_ref
+            self, children=(dest, value), source_ref=source_ref
         )
 
         assert value is not None
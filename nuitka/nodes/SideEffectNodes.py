@@ -106,11 +106,11 @@ class ExpressionSideEffects(ExpressionChildrenHavingBase):
             if side_effect is not None and side_effect.mayHaveSideEffects():
                 new_side_effects.append(side_effect)
 
-        trace_collection.onExpression(self.subnode_expression)
+        expression = trace_collection.onExpression(self.subnode_expression)
 
         if not new_side_effects:
             return (
-                self.subnode_expression,
+                expression,
                 "new_expression",
                 "Removed empty side effects.",
             )
@@ -118,11 +118,12 @@ class ExpressionSideEffects(ExpressionChildrenHavingBase):
         return self, None, None
 
     def willRaiseException(self, exception_type):
-        for child in self.getVisitableNodes():
-            if child.willRaiseException(exception_type):
+        # Check the children directly, avoiding to build the visitable nodes.
+        for side_effect in self.subnode_side_effects:
+            if side_effect.willRaiseException(exception_type):
                 return True
 
-        return False
+        return self.subnode_expression.willRaiseException(exception_type)
 
     def getTruthValue(self):
         return self.subnode_expression.getTruthValue()
@@ -38,8 +38,6 @@ from .NodeBases import (
 )
 from .NodeMakingHelpers import (
     convertNoneConstantToNone,
-    makeStatementExpressionOnlyReplacementNode,
-    makeStatementOnlyNodesFromExpressions,
     wrapExpressionWithSideEffects,
 )
 from .shapes.BuiltinTypeShapes import tshape_slice
@@ -55,84 +53,30 @@ class StatementAssignmentSlice(StatementChildrenHavingBase):
 
         StatementChildrenHavingBase.__init__(
             self,
-            values={
-                "source": source,
-                "expression": expression,
-                "lower": lower,
-                "upper": upper,
-            },
+            children=(source, expression, lower, upper),
             source_ref=source_ref,
         )
 
     def computeStatement(self, trace_collection):
-        source = trace_collection.onExpression(self.subnode_source)
-
-        # No assignment will occur, if the assignment source raises, so strip it
-        # away.
-        if source.willRaiseException(BaseException):
-            result = makeStatementExpressionOnlyReplacementNode(
-                expression=source, node=self
-            )
-
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in assigned value, removed assignment.""",
-            )
-
-        lookup_source = trace_collection.onExpression(self.subnode_expression)
-
-        if lookup_source.willRaiseException(BaseException):
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source)
-            )
-
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in sliced value, removed assignment.""",
-            )
-
-        lower = trace_collection.onExpression(self.subnode_lower, allow_none=True)
-
-        if lower is not None and lower.willRaiseException(BaseException):
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source, lower)
-            )
-
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in lower slice boundary value, removed \
-assignment.""",
-            )
-
-        upper = trace_collection.onExpression(self.subnode_upper, allow_none=True)
-
-        if upper is not None and upper.willRaiseException(BaseException):
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source, lower, upper)
-            )
+        result, change_tags, change_desc = self.computeStatementSubExpressions(
+            trace_collection=trace_collection
+        )
 
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in upper slice boundary value, removed \
-assignment.""",
-            )
+        if result is not self:
+            return result, change_tags, change_desc
 
-        return lookup_source.computeExpressionSetSlice(
+        return self.subnode_expression.computeExpressionSetSlice(
             set_node=self,
-            lower=lower,
-            upper=upper,
-            value_node=source,
+            lower=self.subnode_lower,
+            upper=self.subnode_upper,
+            value_node=self.subnode_source,
             trace_collection=trace_collection,
         )
 
+    @staticmethod
+    def getStatementNiceName():
+        return "slice assignment statement"
+
 
 class StatementDelSlice(StatementChildrenHavingBase):
     kind = "STATEMENT_DEL_SLICE"
@@ -142,58 +86,29 @@ class StatementDelSlice(StatementChildrenHavingBase):
     def __init__(self, expression, lower, upper, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={"expression": expression, "lower": lower, "upper": upper},
+            children=(expression, lower, upper),
             source_ref=source_ref,
         )
 
     def computeStatement(self, trace_collection):
-        lookup_source = trace_collection.onExpression(self.subnode_expression)
-
-        if lookup_source.willRaiseException(BaseException):
-            result = makeStatementExpressionOnlyReplacementNode(
-                expression=lookup_source, node=self
-            )
-
-            return (
-                result,
-                "new_raise",
-                """\
-Slice del raises exception in sliced value, removed del""",
-            )
-
-        lower = trace_collection.onExpression(self.subnode_lower, allow_none=True)
-
-        if lower is not None and lower.willRaiseException(BaseException):
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(lookup_source, lower)
-            )
-
-            return (
-                result,
-                "new_raise",
-                """
-Slice del raises exception in lower slice boundary value, removed del""",
-            )
-
-        trace_collection.onExpression(self.subnode_upper, allow_none=True)
-        upper = self.subnode_upper
+        result, change_tags, change_desc = self.computeStatementSubExpressions(
+            trace_collection=trace_collection
+        )
 
-        if upper is not None and upper.willRaiseException(BaseException):
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(lookup_source, lower, upper)
-            )
+        if result is not self:
+            return result, change_tags, change_desc
 
-            return (
-                result,
-                "new_raise",
-                """
-Slice del raises exception in upper slice boundary value, removed del""",
-            )
-
-        return lookup_source.computeExpressionDelSlice(
-            set_node=self, lower=lower, upper=upper, trace_collection=trace_collection
+        return self.subnode_expression.computeExpressionDelSlice(
+            set_node=self,
+            lower=self.subnode_lower,
+            upper=self.subnode_upper,
+            trace_collection=trace_collection,
         )
 
+    @staticmethod
+    def getStatementNiceName():
+        return "slice del statement"
+
 
 class ExpressionSliceLookup(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_SLICE_LOOKUP"
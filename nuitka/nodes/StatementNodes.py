@@ -183,12 +183,14 @@ class StatementsSequence(StatementChildHavingBase):
                         "Removed dead statements.",
                     )
 
-                    for s in statements[statements.index(statement) + 1 :]:
+                    for s in statements[count + 1 :]:
                         s.finalize()
 
                     break
 
-        if statements != new_statements:
+        # Only replace the statements, if anything changed, otherwise the
+        # re-parenting and checking would be done for nothing.
+        if statements != tuple(new_statements):
             if new_statements:
                 self.setChild("statements", new_statements)
 
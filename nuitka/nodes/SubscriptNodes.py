@@ -36,7 +36,7 @@ class StatementAssignmentSubscript(StatementChildrenHavingBase):
     def __init__(self, subscribed, subscript, source, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={"source": source, "subscribed": subscribed, "subscript": subscript},
+            children=(source, subscribed, subscript),
             source_ref=source_ref,
         )
 
@@ -68,7 +68,7 @@ class StatementDelSubscript(StatementChildrenHavingBase):
     def __init__(self, subscribed, subscript, source_ref):
         StatementChildrenHavingBase.__init__(
             self,
-            values={"subscribed": subscribed, "subscript": subscript},
+            children=(subscribed, subscript),
             source_ref=source_ref,
         )
 
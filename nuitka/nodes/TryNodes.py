@@ -60,13 +60,13 @@ class StatementTry(StatementChildrenHavingBase):
     ):
         StatementChildrenHavingBase.__init__(
             self,
-            values={
-                "tried": tried,
-                "except_handler": except_handler,
-                "break_handler": break_handler,
-                "continue_handler": continue_handler,
-                "return_handler": return_handler,
-            },
+            children=(
+                tried,
+                except_handler,
+                break_handler,
+                continue_handler,
+                return_handler,
+            ),
             source_ref=source_ref,
         )
 
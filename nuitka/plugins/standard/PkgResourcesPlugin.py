@@ -26,6 +26,32 @@ some packages in their code, e.g. derive their __version__ value from that.
 import re
 
 from nuitka.plugins.PluginBase import NuitkaPluginBase
+from nuitka.PythonVersions import python_version
+
+# All the calls we resolve, in one pattern, so the source is scanned only
+# once. The name of the outer group tells which call was matched.
+_resolvable_calls_re = re.compile(
+    r"""\b(?:"""
+    r"""(?P<get_distribution>pkg_resources\.get_distribution\("""
+    r"""\s*['"](?P<dist_name>[^'"\\\n]*)['"]\s*"""
+    r"""\)\.(?P<dist_attribute>(?:parsed_)?version))"""
+    r"""|(?P<require>pkg_resources\.require\("""
+    r"""\s*['"](?P<requirement>[^'"\\\n]*)['"]\s*"""
+    r"""\))"""
+    r"""|(?P<metadata_version>(?:importlib_)?metadata\.version\("""
+    r"""\s*['"](?P<metadata_dist_name>[^'"\\\n]*)['"]\s*"""
+    r"""\))"""
+    r""")"""
+)
+
+_not_imported = object()
+
+_parsed_version_prefix = "pkg_resources.extern.packaging.version.Version("
+
+# The implementations of these APIs must not be changed.
+_skipped_top_level_names = frozenset(
+    ("pkg_resources", "importlib_metadata", "importlib")
+)
 
 
 class NuitkaPluginResources(NuitkaPluginBase):
@@ -33,72 +59,123 @@ class NuitkaPluginResources(NuitkaPluginBase):
     plugin_desc = "Resolve version numbers at compile time."
 
     def __init__(self):
-        try:
-            import pkg_resources
-        except (ImportError, RuntimeError):
-            self.pkg_resources = None
-        else:
-            self.pkg_resources = pkg_resources
-
-        try:
-            import importlib_metadata
-        except (ImportError, SyntaxError, RuntimeError):
-            self.metadata = None
-        else:
-            self.metadata = importlib_metadata
-
-        # Note: This one is overriding above import, but doesn't need to initialize
-        # the value, since it will already be set in case of a problem.
-        try:
-            from importlib import metadata
+        # These are slow to import, so only do it once a module uses them.
+        self._pkg_resources = _not_imported
+        self._metadata = _not_imported
 
-            self.metadata = metadata
-        except ImportError:
-            pass
+        # Many modules of a package query the same versions, only look up
+        # each distribution once.
+        self.dist_versions = {}
+        self.metadata_versions = {}
+        self.satisfied_requirements = set()
 
     @staticmethod
     def isAlwaysEnabled():
         return True
 
-    def onModuleSourceCode(self, module_name, source_code):
-        if self.pkg_resources:
-            for match in re.findall(
-                r"""\b(pkg_resources\.get_distribution\(\s*['"](.*?)['"]\s*\)\.((?:parsed_)?version))""",
-                source_code,
-            ):
-                value = self.pkg_resources.get_distribution(match[1]).version
-
-                if match[2] == "version":
-                    value = repr(value)
-                elif match[2] == "parsed_version":
-                    value = "pkg_resources.extern.packaging.version.Version(%r)" % value
+    @property
+    def pkg_resources(self):
+        if self._pkg_resources is _not_imported:
+            try:
+                import pkg_resources
+            except (ImportError, RuntimeError):
+                self._pkg_resources = None
+            else:
+                self._pkg_resources = pkg_resources
+
+        return self._pkg_resources
+
+    @property
+    def metadata(self):
+        if self._metadata is _not_imported:
+            # The standard library has it since 3.8, only older versions need
+            # to try the backport.
+            if python_version >= 0x380:
+                from importlib import metadata
+
+                self._metadata = metadata
+            else:
+                try:
+                    import importlib_metadata
+                except (ImportError, SyntaxError, RuntimeError):
+                    self._metadata = None
                 else:
-                    assert False
+                    self._metadata = importlib_metadata
 
-                source_code = source_code.replace(match[0], value)
+        return self._metadata
 
-            for match in re.findall(
-                r"""\b(pkg_resources\.require\(\s*['"](.*?)['"]\s*\))""",
-                source_code,
-            ):
-                # Explicitly call the require function at Nuitka compile, and
-                # if it fails remove it so that it doesn't fail at execution
-                try:
-                    self.pkg_resources.require(match[1])
-                except self.pkg_resources.ResolutionError:
-                    raise self.pkg_resources.ResolutionError(
-                        "Unmet requirement during compilation: "+match[1])
-                else:
-                    source_code = source_code.replace(match[0], "")
+    def _replaceGetDistribution(self, match):
+        dist_name = match.group("dist_name")
+
+        if dist_name not in self.dist_versions:
+            self.dist_versions[dist_name] = self.pkg_resources.get_distribution(
+                dist_name
+            ).version
+
+        value = self.dist_versions[dist_name]
+
+        if match.group("dist_attribute") == "version":
+            return repr(value)
+        elif match.group("dist_attribute") == "parsed_version":
+            return _parsed_version_prefix + repr(value) + ")"
+        else:
+            assert False
+
+    def _replaceRequire(self, match):
+        requirement = match.group("requirement")
 
-        if self.metadata:
-            for match in re.findall(
-                r"""\b((?:importlib_)?metadata\.version\(\s*['"](.*?)['"]\s*\))""",
-                source_code,
-            ):
-                value = self.metadata.version(match[1])
-                value = repr(value)
+        # Explicitly call the require function at Nuitka compile, and
+        # if it fails remove it so that it doesn't fail at execution
+        if requirement not in self.satisfied_requirements:
+            try:
+                self.pkg_resources.require(requirement)
+            except self.pkg_resources.ResolutionError:
+                raise self.pkg_resources.ResolutionError(
+                    "Unmet requirement during compilation: " + requirement
+                )
 
-                source_code = source_code.replace(match[0], value)
+            self.satisfied_requirements.add(requirement)
+
+        return ""
+
+    def _replaceMetadataVersion(self, match):
+        dist_name = match.group("metadata_dist_name")
+
+        if dist_name not in self.metadata_versions:
+            self.metadata_versions[dist_name] = self.metadata.version(dist_name)
+
+        return repr(self.metadata_versions[dist_name])
+
+    def _replaceResolvableCall(self, match):
+        call_kind = match.lastgroup
+
+        if call_kind == "metadata_version":
+            if self.metadata is None:
+                return match.group(0)
+
+            return self._replaceMetadataVersion(match)
+
+        if self.pkg_resources is None:
+            return match.group(0)
+
+        if call_kind == "get_distribution":
+            return self._replaceGetDistribution(match)
+        elif call_kind == "require":
+            return self._replaceRequire(match)
+        else:
+            assert False, call_kind
+
+    def onModuleSourceCode(self, module_name, source_code):
+        if module_name.getTopLevelPackageName() in _skipped_top_level_names:
+            return source_code
+
+        # Most modules use none of these, substring checks are much cheaper
+        # than the regular expression scan.
+        if ("pkg_resources." in source_code and self.pkg_resources) or (
+            "metadata.version" in source_code and self.metadata
+        ):
+            source_code = _resolvable_calls_re.sub(
+                self._replaceResolvableCall, source_code
+            )
 
         return source_code
@@ -69,5 +69,58 @@ def raiseOrderCheck():
         print("caught", repr(e))
 
 
+def sliceRaiseOrderCheck():
+    print("Slices with raising parts:")
+    d = list(range(10))
+
+    def lvalue():
+        print("lvalue", end=" ")
+
+        return d
+
+    def rvalue():
+        print("rvalue", end=" ")
+
+        return range(2)
+
+    def low():
+        print("low", end=" ")
+
+        return 1
+
+    print("Simple slice del with raising upper:", end=" ")
+    try:
+        del lvalue()[: 1 / 0]
+    except Exception as e:
+        print("caught", repr(e))
+
+    print("Simple slice assignment with raising upper:", end=" ")
+    try:
+        lvalue()[: 1 / 0] = rvalue()
+    except Exception as e:
+        print("caught", repr(e))
+
+    print("Simple slice assignment with raising lower:", end=" ")
+    try:
+        lvalue()[1 / 0 :] = rvalue()
+    except Exception as e:
+        print("caught", repr(e))
+
+    print("Simple slice del with raising lower:", end=" ")
+    try:
+        del lvalue()[1 / 0 : 2]
+    except Exception as e:
+        print("caught", repr(e))
+
+    print("Simple slice assignment with raising value:", end=" ")
+    try:
+        lvalue()[low() : 2] = 1 / 0
+    except Exception as e:
+        print("caught", repr(e))
+
+    print(d)
+
+
 setOrderCheck()
 raiseOrderCheck()
+sliceRaiseOrderCheck()